@@ -85,6 +85,8 @@ class FileDownloader:
             downloaded = mp.Value('i', 0)
             lock = threading.Lock()
             start_time = time.time()
+            # Checked once, the per-chunk message would otherwise be formatted for every chunk
+            log_chunks = logger.isEnabledFor(logging.DEBUG)
 
             # Notify UI that download is starting
             progress_queue.put({'type': 'status', 'message': f'Starting download with {thread_count} threads...'})
@@ -92,7 +94,7 @@ class FileDownloader:
             def download_chunk(chunk_info):
                 chunk_start, chunk_end = chunks[chunk_info[0]]
                 temp_file = chunk_info[1]
-                logger.debug(f"Thread {chunk_info[0]} downloading bytes {chunk_start}-{chunk_end}")
+                logger.debug("Thread %s downloading bytes %s-%s", chunk_info[0], chunk_start, chunk_end)
                 headers = {'Range': f'bytes={chunk_start}-{chunk_end}'}
                 response = session.get(url, headers=headers, stream=True)
                 with open(temp_file, 'wb') as f:
@@ -102,7 +104,11 @@ class FileDownloader:
                             with lock:
                                 prev_downloaded = downloaded.value
                                 downloaded.value = max(0, min(downloaded.value + len(chunk), total_size))
-                                logger.debug(f"Thread {chunk_info[0]} wrote {len(chunk)} bytes, prev_downloaded={prev_downloaded}, new_downloaded={downloaded.value}")
+                                if log_chunks:
+                                    logger.debug(
+                                        "Thread %s wrote %s bytes, prev_downloaded=%s, new_downloaded=%s",
+                                        chunk_info[0], len(chunk), prev_downloaded, downloaded.value
+                                    )
                                 if downloaded.value < 0 or downloaded.value > total_size:
                                     logger.warning(f"[BUG] downloaded.value out of bounds: {downloaded.value} (total_size={total_size})")
                                 elapsed = time.time() - start_time
@@ -110,16 +116,13 @@ class FileDownloader:
                                 speed_str = f"{speed/1024/1024:.1f}MB/s"
                                 downloaded_str = f"{max(0, min(downloaded.value, total_size))/1024/1024:.1f}MB"
                                 total_str = f"{total_size/1024/1024:.1f}MB"
-                                progress = {
-                                    'type': 'progress',
-                                    'data': {
-                                        'progress': (max(0, min(downloaded.value, total_size)) / total_size) * 100 if total_size > 0 else 0,
-                                        'speed': speed_str,
-                                        'downloaded': downloaded_str,
-                                        'total': total_str
-                                    }
-                                }
-                                progress_queue.put(progress)
+                                progress_queue.put_progress(
+                                    'progress',
+                                    (max(0, min(downloaded.value, total_size)) / total_size) * 100 if total_size > 0 else 0,
+                                    speed_str,
+                                    downloaded_str,
+                                    total_str
+                                )
                                 if cancel_event and cancel_event.is_set():
                                     f.close()
                                     temp_file.unlink()
@@ -187,22 +190,13 @@ class FileDownloader:
                         speed_str = f"{speed/1024/1024:.1f}MB/s"
                         downloaded_str = f"{max(0, min(downloaded, total_size))/1024/1024:.1f}MB"
                         total_str = f"{total_size/1024/1024:.1f}MB"
-                        progress = {
-                            'type': 'progress',
-                            'data': {
-                                'progress': (max(0, min(downloaded, total_size)) / total_size) * 100 if total_size > 0 else 0,
-                                'speed': speed_str,
-                                'downloaded': downloaded_str,
-                                'total': total_str
-                            }
-                        }
-                        progress_queue.put(progress)
+                        percent = (max(0, min(downloaded, total_size)) / total_size) * 100
+                        progress_queue.put_progress('progress', percent, speed_str, downloaded_str, total_str)
                         # Only log every 5% to reduce spam
-                        if int(progress['data']['progress']) % 5 == 0:
+                        if int(percent) % 5 == 0 and logger.isEnabledFor(logging.DEBUG):
                             logger.debug(
-                                f"Download progress: {progress['data']['progress']:.1f}% "
-                                f"({downloaded_str}/{total_str}) "
-                                f"@ {speed_str}"
+                                "Download progress: %.1f%% (%s/%s) @ %s",
+                                percent, downloaded_str, total_str, speed_str
                             )
             
             logger.info("Download completed successfully")
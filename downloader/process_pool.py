@@ -1,4 +1,5 @@
 import multiprocessing as mp
+from multiprocessing import connection as mp_connection
 from typing import Any, Callable, Optional, Dict
 import uuid
 import time
@@ -24,8 +25,7 @@ class ProcessPool:
         """Start a new process and return its ID"""
         try:
             # Check if we can start a new process
-            active = len([p for p in self.processes.values() if p.is_alive()])
-            if active >= self.max_processes:
+            if self.alive_count >= self.max_processes:
                 raise ProcessError(f"Maximum number of processes ({self.max_processes}) reached")
             
             process_id = str(uuid.uuid4())
@@ -120,14 +120,28 @@ class ProcessPool:
         logger.debug("Process pool cleaned up")
         
     def cleanup_completed(self):
-        """Remove completed processes from the pool"""
-        for process_id in list(self.processes.keys()):
-            if not self.processes[process_id].is_alive():
-                self.processes.pop(process_id)
-                logger.debug(f"Removed completed process {process_id}")
+        """Remove completed processes from the pool
+        
+        Exited processes are found with one wait on all process sentinels instead
+        of an is_alive() call per process.
+        """
+        if not self.processes:
+            return
+        by_sentinel = {process.sentinel: process_id for process_id, process in self.processes.items()}
+        for sentinel in mp_connection.wait(list(by_sentinel), timeout=0):
+            process_id = by_sentinel[sentinel]
+            self.processes.pop(process_id).join()  # Already exited, reaps it
+            self.cancel_events.pop(process_id, None)
+            logger.debug("Removed completed process %s", process_id)
+            
+    @property
+    def alive_count(self) -> int:
+        """Number of processes still running"""
+        self.cleanup_completed()
+        return len(self.processes)
 
     def is_process_running(self, process_id: str) -> bool:
         """Check if a process is still running"""
-        if process_id not in self.processes:
-            return False
-        return self.processes[process_id].is_alive()
+        # Called from the monitor thread while the pool may drop finished processes
+        process = self.processes.get(process_id)
+        return process is not None and process.is_alive()
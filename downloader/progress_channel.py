@@ -0,0 +1,79 @@
+import multiprocessing as mp
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Tuple
+
+
+class ProgressSender:
+    """Write end of a progress pipe, shared by the download process and its children"""
+
+    # Minimum seconds between progress ticks of one kind, the final 100% tick always goes out
+    MIN_PROGRESS_INTERVAL = 0.05
+
+    __slots__ = ('_connection', '_lock', '_last_tick', '_held')
+
+    def __init__(self, connection: Connection, lock):
+        self._connection = connection
+        # YouTube downloads write from several processes at once
+        self._lock = lock
+        # Last sent tick time per kind, each process keeps its own copy
+        self._last_tick = {}
+        # Newest throttled tick per kind, not yet sent
+        self._held = {}
+
+    def put(self, message: Any):
+        """Send a progress message to the UI process, after any tick still held back"""
+        if self._held:
+            self.flush_progress()
+        self._send(message)
+        
+    def _send(self, message: Any):
+        """Write one message to the pipe, dropped if nobody listens anymore"""
+        with self._lock:
+            try:
+                self._connection.send(message)
+            except OSError:
+                # BrokenPipeError included: the UI process closed its end, e.g. on exit
+                pass
+            
+    def put_progress(self, kind: str, progress: float, speed: str, downloaded: str, total: str):
+        """Send a progress tick as a flat (kind, progress, speed, downloaded, total) tuple
+        
+        Ticks are by far the most frequent message, a flat tuple pickles smaller and
+        faster than the nested dict used for the other messages. Ticks closer together
+        than MIN_PROGRESS_INTERVAL are held back here, before they cross the pipe; the
+        newest held tick goes out with the next message or flush_progress().
+        """
+        tick = (kind, progress, speed, downloaded, total)
+        now = time.monotonic()
+        if progress < 100 and now - self._last_tick.get(kind, 0.0) < self.MIN_PROGRESS_INTERVAL:
+            self._held[kind] = tick
+            return
+        self._last_tick[kind] = now
+        self._held.pop(kind, None)
+        self._send(tick)
+        
+    def flush_progress(self):
+        """Send the newest held back tick of every kind, so bars end on the last value"""
+        while self._held:
+            try:
+                _, tick = self._held.popitem()
+            except KeyError:
+                # Another download thread flushed it first
+                break
+            self._send(tick)
+            
+    def close(self):
+        """Close this process's copy of the write end
+        
+        The UI process calls this once the download process has started, so the
+        reader sees EOF when the download processes exit. The lock must stay
+        referenced until then, children that haven't unpickled it yet need it.
+        """
+        self._connection.close()
+
+
+def progress_pipe() -> Tuple[Connection, ProgressSender]:
+    """Create a one-way progress channel, returning (reader, sender)"""
+    reader, writer = mp.Pipe(duplex=False)
+    return reader, ProgressSender(writer, mp.Lock())
@@ -46,7 +46,7 @@ def ensure_supported_yt_dlp() -> None:
     if current < REQUIRED_YTDLP_VERSION:
         raise DownloadError(
             "Your yt-dlp installation is too old for YouTube audio downloads. "
-            "Please reinstall using the pinned git commit from requirements.txt."
+            "Please upgrade it with: pip install -U -r requirements.txt"
         )
     _version_checked = True
 
@@ -567,21 +567,28 @@ class YouTubeDownloader:
                     speed_str = f"{speed/1024/1024:.1f} MB/s" if speed else ""
                     downloaded_str = f"{downloaded/1024/1024:.1f} MB"
                     total_str = f"{total/1024/1024:.1f} MB"
-                    progress_queue.put({
-                        'type': f'{stream_type}_progress',
-                        'data': {
-                            'progress': progress,
-                            'speed': speed_str,
-                            'downloaded': downloaded_str,
-                            'total': total_str
-                        }
-                    })
+                    progress_queue.put_progress(
+                        f'{stream_type}_progress', progress, speed_str, downloaded_str, total_str)
             except Exception as e:
                 logger.error(f"Error in progress hook: {str(e)}", exc_info=True)
+        elif d['status'] == 'finished':
+            # The stream may end on a throttled tick, send it before going quiet
+            progress_queue.flush_progress()
                 
     @staticmethod
-    def download_stream(url: str, options: dict, stream_type: str, progress_queue: Any, cancel_event: Event):
-        """Download a single stream (video or audio)"""
+    def download_stream(
+        url: str,
+        options: dict,
+        stream_type: str,
+        progress_queue: Any,
+        cancel_event: Event,
+        info: Optional[Dict[str, Any]] = None
+    ):
+        """Download a single stream (video or audio)
+        
+        When info is given, the already extracted video info is reused instead
+        of fetching it from YouTube again.
+        """
         try:
             ensure_supported_yt_dlp()
             logger.info(f"Starting {stream_type} download for {url}")
@@ -596,7 +603,10 @@ class YouTubeDownloader:
                 YouTubeDownloader.stream_progress_hook(d, stream_type, progress_queue)
             options['progress_hooks'] = [progress_hook]
             with yt_dlp.YoutubeDL(options) as ydl:
-                ydl.download([url])
+                if info is not None:
+                    ydl.process_ie_result(info, download=True)
+                else:
+                    ydl.download([url])
             logger.info(f"Finished {stream_type} download")
             
         except Exception as e:
@@ -633,7 +643,12 @@ class YouTubeDownloader:
             
             # Get video info
             with yt_dlp.YoutubeDL() as ydl:
-                info = ydl.extract_info(url, download=False)
+                # Unprocessed, so each stream process still selects its own format; sanitized
+                # so it can be handed to them
+                info = ydl.sanitize_info(
+                    ydl.extract_info(url, download=False, process=False),
+                    remove_private_keys=True
+                )
                 
             # Send title to progress queue immediately
             title = info.get('title', url)
@@ -686,7 +701,7 @@ class YouTubeDownloader:
                 progress_queue.put({'type': 'status', 'message': 'Downloading...'})
                 audio_process = Process(
                     target=YouTubeDownloader.download_stream,
-                    args=(url, audio_opts, 'audio', progress_queue, cancel_event)
+                    args=(url, audio_opts, 'audio', progress_queue, cancel_event, info)
                 )
                 audio_process.start()
                 processes.append(audio_process)
@@ -696,7 +711,7 @@ class YouTubeDownloader:
                 progress_queue.put({'type': 'status', 'message': 'Downloading...'})
                 video_process = Process(
                     target=YouTubeDownloader.download_stream,
-                    args=(url, video_opts, 'video', progress_queue, cancel_event)
+                    args=(url, video_opts, 'video', progress_queue, cancel_event, info)
                 )
                 video_process.start()
                 processes.append(video_process)
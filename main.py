@@ -1,10 +1,13 @@
 import sys
+import threading
 from pathlib import Path
-import customtkinter as ctk
 from utils.logger import Logger
-from ui.main_window import MainWindow
 
 def main():
+    # Warm up the customtkinter import while the logger initializes
+    ctk_import = threading.Thread(target=lambda: __import__("customtkinter"), daemon=True)
+    ctk_import.start()
+    
     # Initialize logger first
     logger = Logger.get_instance()
     
@@ -13,6 +16,9 @@ def main():
         
         # Initialize customtkinter
         logger.debug("Initializing customtkinter")
+        ctk_import.join()
+        import customtkinter as ctk
+        from ui.main_window import MainWindow
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
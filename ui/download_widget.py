@@ -1,379 +1,772 @@
 import customtkinter as ctk
+from customtkinter.windows.widgets.scaling import ScalingTracker
 import tkinter as tk  # Import tkinter for Canvas
-import uuid
-from typing import Callable, Optional
+import logging
+import os
+import subprocess
+import threading
+import time
+import types
+import itertools
+import weakref
+from functools import lru_cache, partial, wraps
+from typing import Callable, Dict, Optional, Tuple
 from utils.logger import Logger
-from utils.exceptions import JustDownloadItError
 
 logger = Logger.get_logger(__name__)
 
+# Opener for downloaded files, resolved once for this platform
+if os.name == 'nt':
+    _open_file = os.startfile
+elif os.name == 'posix':
+    def _open_file(path: str):
+        subprocess.Popen(['xdg-open', path])
+else:
+    def _open_file(path: str):
+        subprocess.Popen(['open', path])
+
+# Close button colors
+_CLOSE_COLOR = "#b22222"  # Firebrick red
+
+# Close button options other than the font, which needs a Tk root
+_CLOSE_BTN_STYLE = dict(
+    text="✕",
+    width=24,
+    height=24,
+    fg_color="transparent",
+    hover_color=_CLOSE_COLOR,
+    text_color=_CLOSE_COLOR,
+)
+
+# Caption of each progress bar kind
+_BAR_LABELS = {"file": "File:", "video": "Video:", "audio": "Audio:", "muxing": "Muxing:"}
+
+# Fixed grid row of each progress bar kind inside the progress section
+_BAR_ROWS = {"file": 0, "video": 1, "audio": 2, "muxing": 3}
+
+_STATIC_LABEL_KWARGS = dict(width=50)
+_VALUE_LABEL_KWARGS = dict(width=150)
+
+# Geometry options of the widget's rows
+_TITLE_GRID = dict(row=0, column=0, sticky="ew", padx=(10, 5), pady=(4, 0))
+_CLOSE_GRID = dict(row=0, column=1, sticky="e", padx=(2, 7), pady=(4, 0))
+_PROGRESS_GRID = dict(row=1, column=0, columnspan=2, sticky="ew", padx=5, pady=(2, 0))
+_STATUS_GRID = dict(row=2, column=0, sticky="w", padx=(10, 5), pady=(2, 4))
+_OPEN_GRID = dict(row=2, column=1, sticky="e", padx=(5, 10), pady=(2, 4))
+
+# Geometry options of the widgets inside a progress bar row
+_BAR_ITEM_PACK = dict(side="left", padx=5)
+_BAR_FILL_PACK = dict(side="left", fill="x", expand=True, padx=5)
+
+
+# Progress bar colors by download phase
+_COLOR_PENDING = "#FFD700"  # Gold/yellow: muxing, preparing, fetching, starting
+_COLOR_COMPLETE = "#32CD32"  # Lime green
+_COLOR_ACTIVE = "#1f538d"  # Default blue
+
+# (match, token, bar color, open button state, is error) checked in order against
+# the lowercased status; a None color or state leaves it unchanged
+_STATUS_RULES = (
+    (str.startswith, "error:", None, "disabled", True),
+    (str.__contains__, "muxing", _COLOR_PENDING, None, False),
+    (str.__contains__, "preparing", _COLOR_PENDING, None, False),
+    (str.__contains__, "fetching", _COLOR_PENDING, None, False),
+    (str.startswith, "starting download", _COLOR_PENDING, None, False),
+    (str.startswith, "download complete", _COLOR_COMPLETE, "normal", False),
+    (str.startswith, "finished", _COLOR_COMPLETE, "normal", False),
+    (str.startswith, "download cancelled", None, "disabled", False),
+    (str.startswith, "download failed", None, "disabled", False),
+)
+# Any other status (downloading, etc.)
+_DEFAULT_STATUS_RULE = (_COLOR_ACTIVE, "disabled", False)
+
+# (bar color, open button state, is error) for callers that pass an explicit state
+_STATE_RULES = {
+    "error": (None, "disabled", True),
+    "pending": (_COLOR_PENDING, None, False),
+    "progress": _DEFAULT_STATUS_RULE,
+    "complete": (_COLOR_COMPLETE, "normal", False),
+}
+
+
+@lru_cache(maxsize=256)
+def _classify_status(status: str) -> Tuple[Optional[str], Optional[str], bool]:
+    """Map a status string to (bar color, open button state, is error)"""
+    # Statuses come from a small set of messages, so the lowercasing and rule
+    # scan run once per distinct string
+    status_lower = status.lower()
+    for matches, token, color, open_state, is_error in _STATUS_RULES:
+        if matches(status_lower, token):
+            return color, open_state, is_error
+    return _DEFAULT_STATUS_RULE
+
+
+def _weak_callback(callback: Optional[Callable]):
+    """Wrap a bound method in a WeakMethod, leave other callables as they are"""
+    if isinstance(callback, types.MethodType):
+        return weakref.WeakMethod(callback)
+    return callback
+
+
+def _resolve_callback(callback) -> Optional[Callable]:
+    """Return the callable behind a callback stored by _weak_callback"""
+    if isinstance(callback, weakref.WeakMethod):
+        return callback()
+    return callback
+
+
+def _guard_ui(action: str):
+    """Skip the method once the widget is destroyed, logging and swallowing any failure"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            # is_destroyed is set first thing in destroy(), so no winfo_exists() round-trip
+            if self.is_destroyed:
+                return None
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                # Callers are monitor threads and the Tk pump, which can't act on a re-raise
+                if logger.isEnabledFor(logging.ERROR):
+                    # A Tk widget torn down under us is expected, a traceback adds nothing
+                    gone = isinstance(e, tk.TclError) and "invalid command name" in str(e)
+                    logger.error(f"Error {action}: {str(e)}", exc_info=not gone)
+                return None
+        return wrapper
+    return decorator
+
+
+def _pct_to_fraction(progress: float) -> float:
+    """Convert a 0-100 percentage into a clamped 0-1 progress bar value"""
+    p = progress * 0.01
+    return 1.0 if p > 1.0 else (0.0 if p < 0.0 else p)
+
 class DownloadWidget(ctk.CTkFrame):
+    # Minimum seconds between redraws of a bar whose whole percentage is unchanged
+    MIN_RENDER_INTERVAL = 0.1
+
+    # Smallest progress bar change (0-1) worth a redraw
+    MIN_BAR_STEP = 0.005
+
+    # Milliseconds a flush waits after the first queued update, so later ones coalesce into it
+    PUMP_INTERVAL_MS = 50
+
+    # Maximum number of released widgets kept for reuse
+    POOL_SIZE = 10
+
+    # Progress bar and value label attribute names per progress kind
+    _BARS = {
+        "file": ("file_progress", "file_label"),
+        "video": ("video_progress", "video_label"),
+        "audio": ("audio_progress", "audio_label"),
+        "muxing": ("muxing_progress", "muxing_label"),
+    }
+
+    # Fonts shared by every DownloadWidget. CTkFont needs a Tk root, so they are
+    # built on first use for the current root instead of at import time.
+    _TITLE_FONT: Optional[ctk.CTkFont] = None
+    _MONO_FONT: Optional[ctk.CTkFont] = None
+    _font_root = None
+
+    # Whether the progress bar option probe has been logged
+    _probed = False
+
+    # Option name used to color progress bars, resolved on first use
+    _PROGRESS_KW: Optional[str] = None
+
+    # Source of widget ids, monotonically increasing
+    _id_gen = itertools.count(1)
+
+    # Live widgets by id, used by the shared button dispatcher
+    _instances: "weakref.WeakValueDictionary[int, DownloadWidget]" = weakref.WeakValueDictionary()
+
+    # Latest (handler, args) per (widget_id, kind), written by worker threads and
+    # applied on the Tk thread by a single shared pump, scheduled only while
+    # updates are queued
+    _pending: Dict[Tuple[int, str], Tuple[Callable, tuple]] = {}
+    _pump_scheduled = False
+    _pump_lock = threading.Lock()
+    _pump_master = None
+
+    # Released widgets waiting to be reused by acquire()
+    _pool: list = []
+
     def __init__(
         self,
         master,
         url: str,
         title: str,
-        on_cancel: Optional[Callable[[], None]] = None,
-        on_clear: Optional[Callable[[], None]] = None,
+        on_cancel: Optional[Callable[[int], None]] = None,
+        on_clear: Optional[Callable[[int], None]] = None,
         file_type: str = "file",  # new parameter: 'file', 'audio', 'video', 'muxing'
         **kwargs
     ):
         """Initialize download widget"""
         super().__init__(master, **kwargs)
+        # CTk children taken off the global scaling tracker, scaled through this frame instead
+        self._scaled_children = []
         
         self.url = url
-        self.id = str(uuid.uuid4())  # Generate unique ID for this widget
+        self.id = next(DownloadWidget._id_gen)  # Unique ID for this widget
         self.process_id = None  # Store process ID for cancellation
         self.is_cancelled = False
         self.is_completed = False  # Initialize is_completed attribute
-        self.on_cancel = on_cancel
-        self.on_clear = on_clear
+        # Bound-method callbacks are held weakly so the widget doesn't keep their owner alive
+        self.on_cancel = _weak_callback(on_cancel)
+        self.on_clear = _weak_callback(on_clear)
         self.is_destroyed = False  # Track if widget is destroyed
+        self.downloaded_paths: Optional[list] = None  # Set when the download completes
+        DownloadWidget._instances[self.id] = self
+        DownloadWidget._pump_master = master
+        self._init_state()
+        # Last color applied to each progress bar
+        self._current_color = {}
+        
+        title_font, _ = DownloadWidget._fonts(master)
         
-        # Create main content frame
-        content = ctk.CTkFrame(self)
-        content.pack(fill="x", padx=5, pady=2)
+        # Lay out title, progress and status rows directly on this frame
+        self.grid_columnconfigure(0, weight=1)
         
         # Title
-        title_row = ctk.CTkFrame(content)
-        title_row.pack(fill="x", padx=0, pady=(2,0))
         self.title_label = ctk.CTkLabel(
-            title_row,
+            self,
             text=title,
             anchor="w",
-            font=("", 12, "bold")
+            font=title_font
         )
-        self.title_label.pack(side="left", fill="x", expand=True, padx=5)
+        self.title_label.grid(**_TITLE_GRID)
         # Add [X] close button
         self.close_btn = ctk.CTkButton(
-            title_row,
-            text="✕",
-            width=24,
-            height=24,
-            fg_color="transparent",
-            hover_color="#b22222",
-            text_color="#b22222",
-            font=("", 12, "bold"),
-            command=self._on_close_click
+            self,
+            font=title_font,
+            command=self._click_command("_on_close_click"),
+            **_CLOSE_BTN_STYLE
         )
-        self.close_btn.pack(side="right", padx=2)
-        
-        # Progress section
-        self.progress_frame = ctk.CTkFrame(content)
-        self.progress_frame.pack(fill="x", pady=(2,0))
-
-        # File progress (generic)
-        self.file_frame = ctk.CTkFrame(self.progress_frame)
-        self.file_frame.pack(fill="x", pady=2)
-        ctk.CTkLabel(self.file_frame, text="File:", width=50).pack(side="left", padx=5)
-        self.file_progress = ctk.CTkProgressBar(self.file_frame)
-        self.file_progress.pack(side="left", fill="x", expand=True, padx=5)
-        self.file_progress.set(0)
-        self.file_label = ctk.CTkLabel(self.file_frame, text="", width=150)
-        self.file_label.pack(side="left", padx=5)
-
-        # Video progress
-        self.video_frame = ctk.CTkFrame(self.progress_frame)
-        self.video_frame.pack(fill="x", pady=2)
-        ctk.CTkLabel(self.video_frame, text="Video:", width=50).pack(side="left", padx=5)
-        self.video_progress = ctk.CTkProgressBar(self.video_frame)
-        self.video_progress.pack(side="left", fill="x", expand=True, padx=5)
-        self.video_progress.set(0)
-        self.video_label = ctk.CTkLabel(self.video_frame, text="", width=150)
-        self.video_label.pack(side="left", padx=5)
-
-        # Audio progress
-        self.audio_frame = ctk.CTkFrame(self.progress_frame)
-        self.audio_frame.pack(fill="x", pady=2)
-        ctk.CTkLabel(self.audio_frame, text="Audio:", width=50).pack(side="left", padx=5)
-        self.audio_progress = ctk.CTkProgressBar(self.audio_frame)
-        self.audio_progress.pack(side="left", fill="x", expand=True, padx=5)
-        self.audio_progress.set(0)
-        self.audio_label = ctk.CTkLabel(self.audio_frame, text="", width=150)
-        self.audio_label.pack(side="left", padx=5)
-
-        # Muxing progress
-        self.muxing_frame = ctk.CTkFrame(self.progress_frame)
-        self.muxing_frame.pack(fill="x", pady=2)  # Pack initially so it's properly configured
-        ctk.CTkLabel(self.muxing_frame, text="Muxing:", width=50).pack(side="left", padx=5)
-        self.muxing_progress = ctk.CTkProgressBar(self.muxing_frame)
-        self.muxing_progress.pack(side="left", fill="x", expand=True, padx=5)
-        self.muxing_progress.set(0)
-        self.muxing_label = ctk.CTkLabel(self.muxing_frame, text="", width=150)
-        self.muxing_label.pack(side="left", padx=5)
-
-        # Hide all progress bars initially
-        self.file_frame.pack_forget()
-        self.video_frame.pack_forget()
-        self.audio_frame.pack_forget()
-        self.muxing_frame.pack_forget()
+        self.close_btn.grid(**_CLOSE_GRID)
+        
+        # Progress section. The progress section and bar rows are purely structural,
+        # so they are plain tk.Frames painted in this frame's color rather than
+        # canvas-drawn CTkFrames.
+        self._surface_color = self._detect_color_of_master(self)
+        self._plain_frames = []
+        self.progress_frame = self._plain_frame(self)
+        self.progress_frame.grid(**_PROGRESS_GRID)
+        self.progress_frame.grid_columnconfigure(0, weight=1)
+
+        self._untrack_scaling(self.title_label, self.close_btn)
+
+        # Progress bars are built on first show; only the one for file_type is created now
+        self.file_frame = self.file_progress = self.file_label = None
+        self.video_frame = self.video_progress = self.video_label = None
+        self.audio_frame = self.audio_progress = self.audio_label = None
+        self.muxing_frame = self.muxing_progress = self.muxing_label = None
+
+        # Track which progress frames are gridded so repeated show_* calls are no-ops
+        # and visibility checks don't need a winfo_viewable() round-trip
+        self._shown = {"file": False, "video": False, "audio": False, "muxing": False}
 
         # Show the correct progress bar based on file_type
-        if file_type == "file":
-            self.file_frame.pack(fill="x", pady=2)
-        elif file_type == "audio":
-            self.audio_frame.pack(fill="x", pady=2)
-        elif file_type == "video":
-            self.video_frame.pack(fill="x", pady=2)
-        elif file_type == "muxing":
-            self.muxing_frame.pack(fill="x", pady=2)
+        self._show_for_type(file_type)
 
         # Status and open
-        status_frame = ctk.CTkFrame(content)
-        status_frame.pack(fill="x", pady=(2,2))
         self.status_label = ctk.CTkLabel(
-            status_frame,
+            self,
             text="Preparing download...",
             anchor="w"
         )
-        self.status_label.pack(side="left", padx=5)
+        self.status_label.grid(**_STATUS_GRID)
         # Repurpose Clear button to Open
         self.open_btn = ctk.CTkButton(
-            status_frame,
+            self,
             text="Open",
             width=60,
-            command=self._on_open_click
+            state="disabled",  # Initially disabled
+            command=self._click_command("_on_open_click")
         )
-        self.open_btn.pack(side="right", padx=5)
-        self.open_btn.configure(state="disabled")  # Initially disabled
+        self.open_btn.grid(**_OPEN_GRID)
+        self._open_btn_state = "disabled"
+        self._untrack_scaling(self.status_label, self.open_btn)
         logger.debug(f"Download widget created with URL: {self.url} and file_type: {file_type}")
         
-        # Debug: Check what parameters are available on progress bars
+        # Debug: Check what parameters are available on progress bars (once per run)
+        if not DownloadWidget._probed and logger.isEnabledFor(logging.DEBUG):
+            DownloadWidget._probed = True
+            try:
+                probe_bar = next(getattr(self, f"{kind}_progress") for kind in _BAR_LABELS if self._shown[kind])
+                logger.debug(f"Progress bar config keys: {list(probe_bar.configure().keys())}")
+            except Exception as e:
+                logger.debug(f"Could not get progress bar config: {e}")
+        
+    def _init_state(self):
+        """Reset the per-download render state"""
+        # Set once cancellation was requested, so repeated close clicks don't re-dispatch
+        self._cancel_requested = False
+        # Per-bar render throttling state
+        self._last_render_ts = {"file": 0.0, "video": 0.0, "audio": 0.0, "muxing": 0.0}
+        self._last_pct = {"file": -1, "video": -1, "audio": -1, "muxing": -1}
+        self._last_status: Optional[str] = None
+        # Last text shown in each progress bar's value label
+        self._last_labels: Dict[str, str] = {}
+        # Last value set on each progress bar (0-1)
+        self._last_fraction = {"file": 0.0, "video": 0.0, "audio": 0.0, "muxing": 0.0}
+        
+    def _click_command(self, handler: str):
+        """Button command routing a click to handler on the widget with this id"""
+        return partial(DownloadWidget._dispatch_click, self.id, handler)
+        
+    def _show_for_type(self, file_type: str):
+        """Show the progress bar matching file_type"""
+        if file_type == "file":
+            self.show_file_progress()
+        elif file_type == "audio":
+            self.show_audio_progress()
+        elif file_type == "video":
+            self.show_video_progress()
+        elif file_type == "muxing":
+            self._show_bar("muxing")
+            
+    @classmethod
+    def acquire(
+        cls,
+        master,
+        url: str,
+        title: str,
+        on_cancel: Optional[Callable[[int], None]] = None,
+        on_clear: Optional[Callable[[int], None]] = None,
+        file_type: str = "file",
+        **kwargs
+    ) -> "DownloadWidget":
+        """Return a released widget reset for a new download, or create one
+        
+        kwargs are only used when a new widget has to be created.
+        """
+        while cls._pool:
+            widget = cls._pool.pop()
+            if widget.is_destroyed:
+                continue
+            if widget.master is master:
+                widget._reset(url, title, on_cancel, on_clear, file_type)
+                return widget
+            widget.destroy()
+        return cls(master, url, title, on_cancel=on_cancel, on_clear=on_clear, file_type=file_type, **kwargs)
+        
+    def release(self):
+        """Unpack a finished widget and keep it for reuse, destroying it if the pool is full"""
+        if self.is_destroyed:
+            return
+        if len(DownloadWidget._pool) >= self.POOL_SIZE:
+            self.destroy()
+            return
+        # Drop the id so queued updates and clicks for the old download are ignored
+        DownloadWidget._instances.pop(self.id, None)
+        self.pack_forget()
+        DownloadWidget._pool.append(self)
+        
+    def _reset(self, url: str, title: str, on_cancel, on_clear, file_type: str):
+        """Prepare a released widget for a new download"""
+        self.url = url
+        self.id = next(DownloadWidget._id_gen)
+        self.process_id = None
+        self.is_cancelled = False
+        self.is_completed = False
+        self.on_cancel = _weak_callback(on_cancel)
+        self.on_clear = _weak_callback(on_clear)
+        self.downloaded_paths = None
+        DownloadWidget._instances[self.id] = self
+        self._init_state()
+        
+        self.title_label.configure(text=title)
+        self.status_label.configure(text="Preparing download...")
+        self.close_btn.configure(command=self._click_command("_on_close_click"))
+        self.open_btn.configure(command=self._click_command("_on_open_click"))
+        if self._open_btn_state != "disabled":
+            self.open_btn.configure(state="disabled")
+            self._open_btn_state = "disabled"
+        
+        # Clear bars built for the previous download, then show the one for file_type
+        for kind, (bar_attr, _) in self._BARS.items():
+            progress_bar = getattr(self, bar_attr)
+            if progress_bar is not None:
+                progress_bar.set(0)
+                self._set_label(kind, "")
+        self.hide_progress_frame()
+        self._show_for_type(file_type)
+        logger.debug(f"Download widget reused with URL: {self.url} and file_type: {file_type}")
+        
+    def _plain_frame(self, master) -> tk.Frame:
+        """Create a borderless tk.Frame in this widget's current background color"""
+        frame = tk.Frame(master, bg=self._apply_appearance_mode(self._surface_color),
+                         borderwidth=0, highlightthickness=0)
+        self._plain_frames.append(frame)
+        return frame
+        
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        bg = self._apply_appearance_mode(self._surface_color)
+        for frame in self._plain_frames:
+            frame.configure(bg=bg)
+            
+    def _untrack_scaling(self, *widgets):
+        """Remove child widgets from CustomTkinter's scaling tracker
+        
+        The tracker keeps one callback per CTk widget per window and scans that
+        list on every widget destroy; only this frame stays registered and
+        forwards scaling changes to its children in _set_scaling.
+        """
+        for widget in widgets:
+            ScalingTracker.remove_widget(widget._set_scaling, widget)
+            self._scaled_children.append(widget)
+            
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        for widget in self._scaled_children:
+            widget._set_scaling(new_widget_scaling, new_window_scaling)
+            
+    @classmethod
+    def _fonts(cls, master):
+        """Return (title_font, mono_font), creating them once per Tk root"""
+        root = master._root()
+        if cls._font_root is not root:
+            cls._TITLE_FONT = ctk.CTkFont(size=12, weight="bold")
+            cls._MONO_FONT = ctk.CTkFont(size=11)
+            _VALUE_LABEL_KWARGS["font"] = cls._MONO_FONT
+            cls._font_root = root
+        return cls._TITLE_FONT, cls._MONO_FONT
+        
+    @classmethod
+    def _wake_pump(cls):
+        """Schedule a flush of the queued updates unless one is already scheduled
+        
+        Safe to call from any thread; the pump only runs while updates are queued.
+        """
+        with cls._pump_lock:
+            if cls._pump_scheduled:
+                return
+            cls._pump_scheduled = True
+        cls._schedule_flush()
+        
+    @classmethod
+    def _schedule_flush(cls):
+        # Not under the lock: from a worker thread after() waits for the Tk thread
         try:
-            logger.debug(f"Progress bar config keys: {list(self.file_progress.configure().keys())}")
-        except Exception as e:
-            logger.debug(f"Could not get progress bar config: {e}")
+            cls._pump_master.after(cls.PUMP_INTERVAL_MS, cls._flush_pending)
+        except (RuntimeError, tk.TclError):
+            # Master was destroyed or its main loop is gone, the next update retries
+            with cls._pump_lock:
+                cls._pump_scheduled = False
+            
+    @classmethod
+    def _flush_pending(cls):
+        """Apply the latest queued update of every widget, in the order they were queued"""
+        pending = cls._pending
+        batch = []
+        while pending:
+            try:
+                batch.append(pending.popitem())
+            except KeyError:
+                break
+        # popitem() takes the newest entry first; layout changes such as showing the
+        # muxing bar must land before the progress queued after them
+        batch.reverse()
+        for (widget_id, kind), entry in batch:
+            widget = cls._instances.get(widget_id)
+            if widget is None or widget.is_destroyed:
+                continue
+            handler, args = entry
+            try:
+                handler(widget, *args)
+            except Exception as e:
+                logger.error(f"Error applying {kind} update for widget {widget_id}: {str(e)}")
+        with cls._pump_lock:
+            if not pending:
+                # Idle until the next update wakes the pump
+                cls._pump_scheduled = False
+                return
+        # Updates arrived while flushing
+        cls._schedule_flush()
+        
+    def _queue(self, kind: str, handler: Callable, args: tuple):
+        """Record the latest update of one kind for the pump, replacing any older one"""
+        DownloadWidget._pending[(self.id, kind)] = (handler, args)
+        DownloadWidget._wake_pump()
+            
+    @staticmethod
+    def _dispatch_click(widget_id: int, handler: str):
+        """Route a button click to the handler of the widget with the given id"""
+        widget = DownloadWidget._instances.get(widget_id)
+        if widget is not None and not widget.is_destroyed:
+            getattr(widget, handler)()
         
     def _set_progress_color(self, progress_bar, color: str):
         """Set the color of a progress bar"""
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                # Try different possible parameter names for CustomTkinter progress bars
+        if self.is_destroyed or self._current_color.get(progress_bar) == color:
+            return
+        try:
+            if DownloadWidget._PROGRESS_KW is None:
+                # Probe once which option name this CustomTkinter version uses
                 try:
                     progress_bar.configure(progress_color=color)
-                    logger.debug(f"Set progress bar color to: {color} using progress_color")
-                except:
-                    try:
-                        progress_bar.configure(fg_color=color)
-                        logger.debug(f"Set progress bar color to: {color} using fg_color")
-                    except:
-                        progress_bar.configure(progress_color=color)
-                        logger.debug(f"Set progress bar color to: {color} using progress_color (fallback)")
-            except Exception as e:
-                logger.error(f"Error setting progress color: {str(e)}", exc_info=True)
+                    DownloadWidget._PROGRESS_KW = "progress_color"
+                except Exception:
+                    progress_bar.configure(fg_color=color)
+                    DownloadWidget._PROGRESS_KW = "fg_color"
+                logger.debug(f"Progress bar color option resolved to: {DownloadWidget._PROGRESS_KW}")
+            else:
+                progress_bar.configure(**{DownloadWidget._PROGRESS_KW: color})
+            self._current_color[progress_bar] = color
+        except Exception as e:
+            logger.error(f"Error setting progress color: {str(e)}", exc_info=True)
                 
     def _set_all_progress_colors(self, color: str):
         """Set all visible progress bars to the same color"""
-        if not self.is_destroyed and self.winfo_exists():
+        if not self.is_destroyed:
             try:
                 # Check which progress bars are visible and set their colors
-                if self.file_frame.winfo_viewable():
-                    self._set_progress_color(self.file_progress, color)
-                if self.video_frame.winfo_viewable():
-                    self._set_progress_color(self.video_progress, color)
-                if self.audio_frame.winfo_viewable():
-                    self._set_progress_color(self.audio_progress, color)
-                if self.muxing_frame.winfo_viewable():
-                    self._set_progress_color(self.muxing_progress, color)
+                for kind, (bar_attr, _) in self._BARS.items():
+                    if self._shown[kind]:
+                        self._set_progress_color(getattr(self, bar_attr), color)
             except Exception as e:
                 logger.error(f"Error setting all progress colors: {str(e)}", exc_info=True)
         
+    def _build_bar(self, kind: str, label_text: str):
+        """Create the frame, progress bar and value label for one progress kind"""
+        frame = self._plain_frame(self.progress_frame)
+        # CTk widgets can't follow appearance changes of a tk.Frame master, so give
+        # them this frame's (light, dark) color explicitly
+        caption = ctk.CTkLabel(frame, text=label_text, bg_color=self._surface_color, **_STATIC_LABEL_KWARGS)
+        caption.pack(**_BAR_ITEM_PACK)
+        progress_bar = ctk.CTkProgressBar(frame, bg_color=self._surface_color)
+        progress_bar.pack(**_BAR_FILL_PACK)
+        progress_bar.set(0)
+        label = ctk.CTkLabel(frame, text="", bg_color=self._surface_color, **_VALUE_LABEL_KWARGS)
+        label.pack(**_BAR_ITEM_PACK)
+        self._untrack_scaling(caption, progress_bar, label)
+        return frame, progress_bar, label
+        
+    def _show_bar(self, kind: str):
+        """Build the progress bar for kind if needed and grid it in its row"""
+        if self.is_destroyed or self._shown[kind]:
+            return
+        frame = getattr(self, f"{kind}_frame")
+        if frame is None:
+            frame, progress_bar, label = self._build_bar(kind, _BAR_LABELS[kind])
+            setattr(self, f"{kind}_frame", frame)
+            setattr(self, f"{kind}_progress", progress_bar)
+            setattr(self, f"{kind}_label", label)
+            frame.grid(row=_BAR_ROWS[kind], column=0, sticky="ew", pady=2)
+        else:
+            # grid_remove kept the row options, so grid() restores the same slot
+            frame.grid()
+        if not any(self._shown.values()):
+            self.progress_frame.grid()
+        self._shown[kind] = True
+        
+    def _hide_bar(self, kind: str):
+        """Remove the progress bar for kind from the layout, keeping its slot"""
+        frame = getattr(self, f"{kind}_frame")
+        if frame is not None:
+            frame.grid_remove()
+        self._shown[kind] = False
+        
     def show_video_progress(self):
         """Show video progress bar"""
-        if not self.is_destroyed:
-            self.video_frame.pack(fill="x", pady=2)
+        self._show_bar("video")
             
     def show_audio_progress(self):
         """Show audio progress bar"""
-        if not self.is_destroyed:
-            self.audio_frame.pack(fill="x", pady=2)
+        self._show_bar("audio")
             
     def show_muxing_progress(self):
-        """Show muxing progress bar and hide video/audio progress"""
-        if not self.is_destroyed:
-            # Hide video and audio frames
-            self.video_frame.pack_forget()
-            self.audio_frame.pack_forget()
-            
-            # Show muxing frame within the progress frame
-            self.muxing_frame.pack(fill="x", pady=2)
-            self.progress_frame.update()  # Force update to ensure proper layout
+        """Show muxing progress bar and hide video/audio progress
+        
+        Called from the monitor thread, so the layout change is applied by the pump
+        on the Tk thread, ahead of any muxing progress queued after it.
+        """
+        self._queue("layout", DownloadWidget._apply_show_muxing, ())
+        
+    @_guard_ui("showing muxing progress")
+    def _apply_show_muxing(self):
+        if self._shown["muxing"]:
+            return
+        # Hide video and audio frames
+        self._hide_bar("video")
+        self._hide_bar("audio")
+        
+        # Show muxing frame within the progress frame
+        self._show_bar("muxing")
             
     def show_file_progress(self):
-        if not self.is_destroyed:
-            self.file_frame.pack(fill="x", pady=2)
+        """Show file progress bar"""
+        self._show_bar("file")
+            
+    def _set_label(self, kind: str, text: str):
+        """Set the value label of a progress bar if its text changed"""
+        if self._last_labels.get(kind) != text:
+            getattr(self, self._BARS[kind][1]).configure(text=text)
+            self._last_labels[kind] = text
+        
+    def _should_render(self, kind: str, progress: float) -> bool:
+        """Return True if the bar should be redrawn for this progress value"""
+        pct = int(progress)
+        now = time.monotonic()
+        # The completing tick always goes through so the bar never stalls just short of full
+        if (pct == self._last_pct[kind] and pct < 100
+                and now - self._last_render_ts[kind] < self.MIN_RENDER_INTERVAL):
+            return False
+        self._last_pct[kind] = pct
+        self._last_render_ts[kind] = now
+        return True
+        
+    def _queue_progress(self, kind: str, progress: float, speed: str = "", downloaded: str = "",
+                        total: str = "", status: str = ""):
+        """Record the latest progress of one bar for the next pump tick"""
+        self._queue(kind, DownloadWidget._apply, (kind, progress, speed, downloaded, total, status))
+        
+    def _apply(self, kind: str, progress: float, speed: str, downloaded: str, total: str, status: str):
+        """Apply queued progress to the bar of the given kind"""
+        bar_attr, label_attr = self._BARS[kind]
+        progress_bar = getattr(self, bar_attr)
+        if progress_bar is None:
+            return None
+        if not self._should_render(kind, progress):
+            # Held back, not dropped: retry on a later pump tick unless a newer update replaces it
+            DownloadWidget._pending.setdefault(
+                (self.id, kind), (DownloadWidget._apply, (kind, progress, speed, downloaded, total, status)))
+            DownloadWidget._wake_pump()
+            return None
+        return self._render_progress(kind, progress_bar, progress, speed, downloaded, total, status)
+        
+    @_guard_ui("updating progress")
+    def _render_progress(self, kind: str, progress_bar, progress: float, speed: str, downloaded: str,
+                         total: str, status: str):
+        # Progress is already a percentage (0-100), convert to 0-1 for progress bar
+        fraction = _pct_to_fraction(progress)
+        # Changes below half a percent don't move the bar by a visible pixel
+        if fraction == 1.0 or abs(fraction - self._last_fraction[kind]) >= self.MIN_BAR_STEP:
+            progress_bar.set(fraction)
+            self._last_fraction[kind] = fraction
+        if status:
+            self._set_label(kind, status)
+        elif speed and downloaded and total:
+            self._set_label(kind, f"{downloaded}/{total} ({speed})")
             
     def update_video_progress(self, progress: float, speed: str = "", downloaded: str = "", total: str = ""):
         """Update video download progress"""
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                # Progress is already a percentage (0-100), convert to 0-1 for progress bar
-                self.video_progress.set(min(1.0, progress / 100))
-                if speed and downloaded and total:
-                    self.video_label.configure(text=f"{downloaded}/{total} ({speed})")
-            except Exception as e:
-                logger.error(f"Error updating video progress: {str(e)}", exc_info=True)
-                raise JustDownloadItError(f"Error updating video progress: {str(e)}")
+        self._queue_progress("video", progress, speed, downloaded, total)
             
     def update_audio_progress(self, progress: float, speed: str = "", downloaded: str = "", total: str = ""):
         """Update audio download progress"""
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                # Progress is already a percentage (0-100), convert to 0-1 for progress bar
-                self.audio_progress.set(min(1.0, progress / 100))
-                if speed and downloaded and total:
-                    self.audio_label.configure(text=f"{downloaded}/{total} ({speed})")
-            except Exception as e:
-                logger.error(f"Error updating audio progress: {str(e)}", exc_info=True)
-                raise JustDownloadItError(f"Error updating audio progress: {str(e)}")
+        self._queue_progress("audio", progress, speed, downloaded, total)
             
     def update_muxing_progress(self, progress: float, status: str = ""):
         """Update muxing progress"""
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                # Progress is already a percentage (0-100), convert to 0-1 for progress bar
-                self.muxing_progress.set(min(1.0, progress / 100))
-                if status:
-                    self.muxing_label.configure(text=status)
-            except Exception as e:
-                logger.error(f"Error updating muxing progress: {str(e)}", exc_info=True)
-                raise JustDownloadItError(f"Error updating muxing progress: {str(e)}")
+        self._queue_progress("muxing", progress, status=status)
             
     def update_file_progress(self, progress: float, speed: str = "", downloaded: str = "", total: str = ""):
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                self.file_progress.set(min(1.0, progress / 100))
-                if speed and downloaded and total:
-                    self.file_label.configure(text=f"{downloaded}/{total} ({speed})")
-            except Exception as e:
-                logger.error(f"Error updating file progress: {str(e)}", exc_info=True)
-                raise JustDownloadItError(f"Error updating file progress: {str(e)}")
+        """Update file download progress"""
+        self._queue_progress("file", progress, speed, downloaded, total)
             
     def update_title(self, title: str):
         """Update the widget's title"""
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                self.title_label.configure(text=title)
-            except Exception as e:
-                logger.error(f"Error updating title: {str(e)}", exc_info=True)
-                raise JustDownloadItError(f"Error updating title: {str(e)}")
+        self._queue("title", DownloadWidget._apply_title, (title,))
+        
+    @_guard_ui("updating title")
+    def _apply_title(self, title: str):
+        self.title_label.configure(text=title)
             
-    def set_status(self, status: str):
-        """Update status text and enable Open button if download is complete"""
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                self.status_label.configure(text=status)
-                logger.debug(f"Setting status to: '{status}'")
-                
-                # Set progress bar colors based on status
-                status_lower = status.lower()
-                if status_lower.startswith("error:"):
-                    self.is_cancelled = True
-                    self.open_btn.configure(text="Open", state="disabled")
-                    # Keep default color for errors
-                    logger.debug("Status indicates error - keeping default color")
-                elif "muxing" in status_lower or "preparing" in status_lower or "fetching" in status_lower or status_lower.startswith("starting download"):
-                    # Yellow for muxing, preparing, fetching information, or starting download
-                    logger.debug("Status indicates muxing/preparing/fetching/starting - setting yellow")
-                    self._set_all_progress_colors("#FFD700")  # Gold/yellow
-                elif status_lower.startswith("download complete") or status_lower.startswith("finished") or status_lower.startswith("finished!"):
-                    # Green for completed downloads
-                    logger.debug("Status indicates completion - setting green")
-                    self._set_all_progress_colors("#32CD32")  # Lime green
-                    self.open_btn.configure(state="normal")
-                elif status_lower.startswith("download cancelled") or status_lower.startswith("download failed"):
-                    self.open_btn.configure(text="Open", state="disabled")
-                    # Keep default color for cancelled/failed
-                    logger.debug("Status indicates cancelled/failed - keeping default color")
-                else:
-                    # Default color for other statuses (downloading, etc.)
-                    logger.debug("Status indicates downloading - setting blue")
-                    self._set_all_progress_colors("#1f538d")  # Default blue
-                    self.open_btn.configure(state="disabled")
-            except Exception as e:
-                logger.error(f"Error setting status: {str(e)}", exc_info=True)
-                raise JustDownloadItError(f"Error setting status: {str(e)}")
+    def set_status(self, status: str, state: Optional[str] = None):
+        """Update status text and enable Open button if download is complete
+        
+        state is one of "error", "pending", "progress" or "complete"; when omitted
+        it is derived from the status text.
+        """
+        if status == self._last_status:
+            return
+        self._last_status = status
+        # Applied by the pump on the Tk thread; set_status is called from monitor threads
+        self._queue("status", DownloadWidget._apply_status, (status, state))
+        
+    @_guard_ui("setting status")
+    def _apply_status(self, status: str, state: Optional[str] = None):
+        self.status_label.configure(text=status)
+        logger.debug("Setting status to: '%s'", status)
+        
+        # Set progress bar colors and Open button state based on status
+        color, open_state, is_error = _STATE_RULES[state] if state else _classify_status(status)
+        logger.debug("Status maps to color=%s, open_btn=%s", color, open_state)
+        
+        if is_error:
+            self.is_cancelled = True
+        if color is not None:
+            self._set_all_progress_colors(color)
+        # Only reconfigure the button on a state transition, each configure redraws it
+        if open_state is not None and open_state != self._open_btn_state:
+            self.open_btn.configure(state=open_state)
+            self._open_btn_state = open_state
     
+    @_guard_ui("setting downloaded path")
     def set_downloaded_path(self, file_path):
         """Set the path(s) of the downloaded file(s)"""
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                if isinstance(file_path, list):
-                    self.downloaded_paths = file_path
-                else:
-                    self.downloaded_paths = [file_path]
-                logger.debug(f"Set downloaded path(s) for widget {self.id}: {self.downloaded_paths}")
-            except Exception as e:
-                logger.error(f"Error setting downloaded path: {str(e)}", exc_info=True)
-                raise JustDownloadItError(f"Error setting downloaded path: {str(e)}")
+        if isinstance(file_path, list):
+            self.downloaded_paths = file_path
+        else:
+            self.downloaded_paths = [file_path]
+        logger.debug(f"Set downloaded path(s) for widget {self.id}: {self.downloaded_paths}")
             
     def hide_progress_frame(self):
         """Hide the entire progress section"""
-        if not self.is_destroyed and self.winfo_exists():
-            self.video_frame.pack_forget()
-            self.audio_frame.pack_forget()
-            self.muxing_frame.pack_forget()
-            self.progress_frame.pack_forget()
+        if not self.is_destroyed:
+            for kind in self._BARS:
+                self._hide_bar(kind)
+            self.progress_frame.grid_remove()
             
-    def _on_button_click(self):
-        """Handle button click based on current state"""
-        if not self.is_destroyed and self.winfo_exists():
-            try:
-                if not self.is_cancelled:
-                    # Cancel the download
-                    if self.on_cancel:
-                        self.on_cancel()
-                    self.is_cancelled = True
-                    # self.cancel_btn.configure(text="Clear") # Removed as per edit hint
-                else:
-                    # Clear the widget
-                    if self.on_clear:
-                        self.on_clear()
-                    self.destroy()
-            except Exception:
-                pass  # Ignore errors if widget is being destroyed
-                
     def _on_open_click(self):
         """Open the downloaded file(s) if available"""
-        import os
-        import subprocess
-        if hasattr(self, 'downloaded_paths') and self.downloaded_paths:
-            for path in self.downloaded_paths:
-                if path and os.path.exists(path):
-                    try:
-                        if os.name == 'nt':
-                            os.startfile(path)
-                        elif os.name == 'posix':
-                            subprocess.Popen(['xdg-open', path])
-                        else:
-                            subprocess.Popen(['open', path])
-                    except Exception as e:
-                        logger.error(f"Failed to open file: {str(e)}", exc_info=True)
+        paths = self.downloaded_paths
+        if paths:
+            # Shell association lookup can block, keep it off the Tk thread
+            threading.Thread(target=self._open_paths, args=(list(paths),), daemon=True).start()
         else:
             logger.debug("Open button clicked but file(s) do not exist or are not ready.")
+            
+    @staticmethod
+    def _open_paths(paths: list):
+        """Open each existing path with the platform's default application"""
+        for path in paths:
+            if path and os.path.exists(path):
+                try:
+                    _open_file(path)
+                except Exception as e:
+                    logger.error(f"Failed to open file: {str(e)}", exc_info=True)
                 
     def destroy(self):
         """Override destroy to mark widget as destroyed"""
         self.is_destroyed = True
-        super().destroy()
-
-    def _on_cancel(self):
-        """Handle cancel button click"""
-        if self.is_cancelled or self.is_completed:
-            # If already cancelled or completed, clear the widget
-            if self.on_cancel:
-                self.on_cancel(self.id)
-        else:
-            # Cancel the download
-            self.is_cancelled = True
-            # self.cancel_btn.configure(text="Clear") # Removed as per edit hint
-            if self.on_cancel:
-                self.on_cancel(self.id)
+        DownloadWidget._instances.pop(self.id, None)
+        try:
+            # Always runs, it also unregisters the widget from CTk's scaling and
+            # appearance trackers and from its master's children
+            super().destroy()
+        except tk.TclError:
+            # The Tk side is already gone when the parent is being torn down
+            pass
 
     def _on_close_click(self):
-        """Handle close button: cancel if in progress, clear if finished/cancelled"""
+        """Handle close button: cancel if in progress, clear if finished/cancelled
+        
+        Both callbacks receive the widget id.
+        """
         if not self.is_completed and not self.is_cancelled:
-            if self.on_cancel:
-                self.on_cancel(self.id)
+            if self._cancel_requested:
+                return
+            self._cancel_requested = True
+            on_cancel = _resolve_callback(self.on_cancel)
+            if on_cancel:
+                on_cancel(self.id)
         else:
-            self.destroy()
+            on_clear = _resolve_callback(self.on_clear)
+            if on_clear:
+                # The owner drops its reference and releases the widget
+                on_clear(self.id)
+            else:
+                self.destroy()
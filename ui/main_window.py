@@ -1,13 +1,13 @@
 import customtkinter as ctk
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from pathlib import Path
 import threading
-import queue
-from queue import Empty  # Import Empty from queue module
-import multiprocessing as mp
+from collections import deque
+from multiprocessing import connection as mp_connection
+from multiprocessing.connection import Connection
 import time
 import tkinter.messagebox as messagebox
-from tkinter import Tk
+from tkinter import Tk, TclError
 from typing import Optional
 import requests
 from utils.exceptions import DownloadError, YouTubeError, ProcessError, FFmpegError, JustDownloadItError
@@ -15,10 +15,11 @@ from utils.logger import Logger
 from .settings_panel import SettingsPanel
 from .download_widget import DownloadWidget
 from downloader.process_pool import ProcessPool
+from downloader.progress_channel import ProgressSender, progress_pipe
 from downloader.file_downloader import FileDownloader
 from downloader.youtube_downloader import YouTubeDownloader
 from utils import ensure_unique_path
-from utils.utils_ui import is_youtube_url, get_filename_from_url
+from utils.utils_ui import is_youtube_url, is_playlist_url, is_valid_url, get_filename_from_url
 import uuid
 import os
 
@@ -68,18 +69,24 @@ class ResizerFrame(ctk.CTkFrame):
         scaled_delta = int(delta * self.scaling)
         new_height = max(50, self.initial_height + scaled_delta)
         
-        # Update URL field height and track it
+        # Track the height, the widget is resized once per burst of motion events
         self.current_height = new_height
-        self.resized_widget.configure(height=new_height)
-        self.resized_widget.update_idletasks()
+        if self._update_after_id is None:
+            self._update_after_id = self.after_idle(self._commit_resize)
+            
+    def _commit_resize(self):
+        """Apply the latest dragged height, each configure redraws the widget"""
+        self._update_after_id = None
+        self.resized_widget.configure(height=self.current_height)
         
     def _on_release(self, event):
         if self.start_y is None:
             return
             
-        # Cancel any pending updates
+        # Apply a pending resize now instead of at idle
         if self._update_after_id:
             self.after_cancel(self._update_after_id)
+            self._commit_resize()
             
         # Reset everything
         self.start_y = None
@@ -99,7 +106,39 @@ class ResizerFrame(ctk.CTkFrame):
         if hasattr(main_window, 'settings_panel'):
             main_window.update_idletasks()
             
+class _ProgressMonitor:
+    """Progress channel and per-download state watched by the shared monitor thread"""
+    
+    __slots__ = ('widget', 'widget_id', 'process_id', 'cleared', 'reader', 'sender', 'on_message', 'on_idle',
+                 'idle_timeout', 'last_seen', 'is_muxing', 'finished')
+    
+    def __init__(self, widget: DownloadWidget, process_id: str, cleared: threading.Event, reader: Connection,
+                 sender: ProgressSender, on_message: Callable, on_idle: Callable, idle_timeout: float):
+        self.widget = widget
+        # Captured now: once finished, a pooled widget may be handed out again under a new id
+        self.widget_id = widget.id
+        self.process_id = process_id
+        self.cleared = cleared  # Set once the download left active_downloads
+        self.reader = reader  # Read end of the download's progress pipe
+        # The download processes hold the write end; closing ours lets the reader see EOF
+        # once they exit, while the sender keeps its lock alive for them
+        self.sender = sender
+        sender.close()
+        self.on_message = on_message  # (monitor, progress) -> True once finished
+        self.on_idle = on_idle  # (monitor) -> True once finished
+        self.idle_timeout = idle_timeout  # Seconds without messages before on_idle runs
+        self.last_seen = time.monotonic()
+        self.is_muxing = False  # Track if we're in muxing phase
+        # Set once the download is done; the reader is still drained until EOF
+        self.finished = False
+        
 class MainWindow:
+    # Seconds the shared monitor thread waits for progress before running idle checks
+    MONITOR_POLL_INTERVAL = 0.1
+
+    # Milliseconds before retrying admission when the pool is still full of exiting processes
+    ADMISSION_RETRY_MS = 200
+
     def __init__(self):
         try:
             logger.info("Initializing main window")
@@ -170,8 +209,15 @@ class MainWindow:
             self.download_threads = self.settings_panel.thread_var.get()
             
             # Track active and pending downloads
-            self.active_downloads = set()
-            self.pending_downloads = []  # List of (widget_id, url, settings) tuples
+            # process_id -> event set once the download is cleared (finished or cancelled)
+            self.active_downloads: Dict[str, threading.Event] = {}
+            self.pending_downloads = deque()  # Queue of (widget_id, url, settings) tuples
+            self._admission_retry_id = None  # Pending after() id of _retry_admission
+            
+            # Progress channels watched by the single shared monitor thread
+            self._monitors: Dict[Any, _ProgressMonitor] = {}
+            self._monitors_lock = threading.Lock()
+            self._monitor_thread: Optional[threading.Thread] = None
             
             # Download button
             logger.debug("Creating download button")
@@ -242,12 +288,12 @@ class MainWindow:
             self.downloads_frame.pack(fill="both", expand=True, padx=5, pady=(5,5))
             
             # Store active downloads
-            self.downloads: Dict[str, DownloadWidget] = {}
+            self.downloads: Dict[int, DownloadWidget] = {}
+            # Ids of finished, failed or cancelled downloads, only touched on the Tk thread
+            self._completed_widget_ids: set = set()
             
-            # Progress update queue
-            logger.debug("Creating progress update queue")
-            self.progress_queue = queue.Queue()
-            self._start_progress_thread()
+            # Widgets marshal monitor-thread updates onto the Tk thread themselves
+            # (DownloadWidget's shared pump), so no progress polling loop is needed here
             
             # Add status labels at the bottom
             status_container = ctk.CTkFrame(self.root, fg_color="transparent")
@@ -303,100 +349,59 @@ class MainWindow:
         
     def _clear_completed(self):
         """Clear completed downloads"""
-        # Get list of completed downloads first to avoid modifying dict during iteration
-        to_clear = []
-        for widget_id, widget in self.downloads.items():
-            if widget.is_completed or widget.is_cancelled:
-                to_clear.append(widget_id)
-                
-        # Clear each completed/cancelled download
+        # Swap the set out first, removing a widget discards its id from it
+        to_clear, self._completed_widget_ids = self._completed_widget_ids, set()
         for widget_id in to_clear:
-            self._remove_download_widget(widget_id)
+            self._remove_download_widget(widget_id, update_counts=False)
             
         # Update counts after clearing
         self._update_download_counts()
             
-    def _remove_download_widget(self, widget_id: str):
-        """Remove download widget"""
+    def _remove_download_widget(self, widget_id: int, update_counts: bool = True):
+        """Remove download widget
+        
+        Batch removals pass update_counts=False and refresh the counts once afterwards.
+        """
         try:
-            logger.info(f"Removing download widget {widget_id}")
+            logger.info("Removing download widget %s", widget_id)
             if widget_id in self.downloads:
                 # Get widget and process ID
                 widget = self.downloads[widget_id]
                 process_id = widget.process_id
                 
-                # Remove from active downloads if present
-                if process_id and process_id in self.active_downloads:
-                    self.active_downloads.remove(process_id)
-                
                 # Remove from pending downloads if present
-                self.pending_downloads = [(wid, url, settings) for wid, url, settings in self.pending_downloads 
-                                       if wid != widget_id]
+                self.pending_downloads = deque((wid, url, settings) for wid, url, settings in self.pending_downloads
+                                               if wid != widget_id)
                 
-                # Remove widget from UI
-                widget.destroy()
+                # Remove widget from UI; finished widgets are kept for reuse since
+                # their monitor thread no longer touches them
+                if widget.is_completed:
+                    widget.release()
+                else:
+                    widget.destroy()
                 del self.downloads[widget_id]
+                self._completed_widget_ids.discard(widget_id)
                 
                 # Clean up process if it exists
                 if process_id:
                     self._clear_download(process_id)
                     
                 # Update counts after removal
-                self._update_download_counts()
+                if update_counts:
+                    self._update_download_counts()
                     
         except Exception as e:
             logger.error(f"Error removing widget {widget_id}: {str(e)}", exc_info=True)
             
-    def _start_progress_thread(self):
-        """Start thread to handle progress updates"""
-        self._update_progress()
-        
-    def _update_progress(self):
-        """Update progress for all downloads"""
-        try:
-            updates = []
-            # Process all queued progress updates
-            while True:
-                try:
-                    # Collect up to 100 updates at a time to prevent overwhelming the GUI
-                    if len(updates) >= 100:
-                        break
-                    widget_id, source, progress_data = self.progress_queue.get_nowait()
-                    updates.append((widget_id, source, progress_data))
-                except Empty:
-                    break
-                    
-            # Apply all updates in a batch
-            if updates:
-                for widget_id, source, progress_data in updates:
-                    if widget_id in self.downloads:
-                        try:
-                            widget = self.downloads[widget_id]
-                            widget.update_progress(progress_data)
-                        except Exception as e:
-                            logger.error(f"Error updating widget {widget_id}: {str(e)}", exc_info=True)
-                
-                # Only update GUI once after all updates are processed
-                self.root.update_idletasks()
-            
-        except Exception as e:
-            logger.error(f"Error in progress update: {str(e)}", exc_info=True)
-            
-        finally:
-            # Schedule next update
-            if self.root.winfo_exists():
-                # Use longer interval if no updates to process
-                next_interval = 10 if not updates else 50
-                self.root.after(next_interval, self._update_progress)
-                
-    def _create_download_widget(self, title: str, url: str = "", file_type: str = "file") -> str:
+    def _create_download_widget(self, title: str, url: str = "", file_type: str = "file") -> int:
         """Create a new download widget"""
         logger.info(f"Creating download widget for: {title} (type: {file_type})")
-        widget = DownloadWidget(
+        widget = DownloadWidget.acquire(
             self.downloads_frame,
             url=url,
             title=title,
             on_cancel=self._cancel_download,
+            on_clear=self._remove_download_widget,
             file_type=file_type
         )
         widget.pack(fill="x", padx=5, pady=2)
@@ -404,7 +409,7 @@ class MainWindow:
         logger.info(f"Download widget created: {widget.id}")
         return widget.id
         
-    def _cancel_download(self, widget_id: str):
+    def _cancel_download(self, widget_id: int):
         """Cancel download process"""
         try:
             logger.info(f"Cancelling download for widget {widget_id}")
@@ -413,37 +418,43 @@ class MainWindow:
                 if hasattr(widget, 'process_id'):  # Check if process ID exists
                     self.process_pool.terminate_process(widget.process_id)
                     widget.set_status("Download cancelled")
+                    # The monitor stops without finishing the widget, so the next X click dismisses it
+                    widget.is_cancelled = True
+                    self._completed_widget_ids.add(widget_id)
                     self._clear_download(widget.process_id)
         except Exception as e:
             logger.error(f"Error cancelling download: {str(e)}", exc_info=True)
             if widget_id in self.downloads:
                 self.downloads[widget_id].set_status("Error cancelling download")
             
-    def _download_file(self, widget_id: str, url: str, settings: dict):
+    def _download_file(self, widget_id: int, url: str, settings: dict):
         """Download regular file"""
         try:
             if widget_id not in self.downloads:
                 logger.error(f"No widget found for ID: {widget_id}")
                 return
             widget = self.downloads[widget_id]
-            progress_queue = mp.Queue()
+            progress_reader, progress_sender = progress_pipe()
             try:
                 process_id = self.process_pool.start_process(
                     FileDownloader.download,
-                    args=(url, str(settings['download_folder']), progress_queue, self.download_threads)
+                    args=(url, str(settings['download_folder']), progress_sender, self.download_threads)
                 )
-                self.active_downloads.add(process_id)
+                self.active_downloads[process_id] = threading.Event()
                 widget.process_id = process_id
-                threading.Thread(
-                    target=self._monitor_download_progress,
-                    args=(widget, process_id, progress_queue),
-                    daemon=True
-                ).start()
-            except RuntimeError as e:
+                widget.show_file_progress()
+                widget.set_status("Starting download...")  # Initial status - yellow
+                self._start_monitor(_ProgressMonitor(
+                    widget, process_id, self.active_downloads[process_id], progress_reader, progress_sender,
+                    self._on_file_message, self._on_file_idle, idle_timeout=0.5
+                ))
+            except ProcessError as e:
                 if "Maximum number of processes" in str(e):
-                    self.pending_downloads.append((widget_id, url, settings))
+                    # A finished download's process is still exiting, retry shortly
+                    self.pending_downloads.appendleft((widget_id, url, settings))
                     widget.set_status("Waiting for available slot...")
                     logger.debug(f"Queued download for later: {url}")
+                    self._schedule_admission_retry()
                     self._update_download_counts()
                     return
                 raise
@@ -454,7 +465,7 @@ class MainWindow:
             logger.error(f"Failed to start download: {str(e)}", exc_info=True)
             messagebox.showerror("Error", f"Failed to start download: {str(e)}")
             
-    def _download_youtube(self, widget_id: str, url: str, settings: dict):
+    def _download_youtube(self, widget_id: int, url: str, settings: dict):
         """Download YouTube video"""
         try:
             # Get widget by ID
@@ -463,8 +474,8 @@ class MainWindow:
                 return
             widget = self.downloads[widget_id]
                 
-            # Create a queue for progress updates
-            progress_queue = mp.Queue()
+            # Create a pipe for progress updates
+            progress_reader, progress_sender = progress_pipe()
             
             try:
                 # Start download process - video info will be gathered in the process
@@ -472,27 +483,31 @@ class MainWindow:
                     YouTubeDownloader.download_process,
                     args=(url, str(settings['download_folder']), settings['video_quality'],
                           settings['audio_quality'], settings['audio_enabled'], settings['video_enabled'], 
-                          settings['muxing_enabled'], progress_queue)
+                          settings['muxing_enabled'], progress_sender)
                 )
                 
                 # Store process ID in widget
-                self.active_downloads.add(process_id)
+                self.active_downloads[process_id] = threading.Event()
                 widget.process_id = process_id  # Store process ID in widget for cancellation
                 
-                # Start monitoring progress
-                has_video = settings['video_enabled']
-                has_audio = settings['audio_enabled']
-                threading.Thread(
-                    target=self._monitor_youtube_progress,
-                    args=(widget, process_id, progress_queue, has_video, has_audio),
-                    daemon=True
-                ).start()
+                # Show appropriate progress bars and start monitoring progress
+                if settings['audio_enabled']:
+                    widget.show_audio_progress()  # Show audio progress if downloading audio
+                if settings['video_enabled']:
+                    widget.show_video_progress()  # Show video progress if downloading video
+                widget.set_status("Starting download...")  # Initial status - yellow
+                self._start_monitor(_ProgressMonitor(
+                    widget, process_id, self.active_downloads[process_id], progress_reader, progress_sender,
+                    self._on_youtube_message, self._on_youtube_idle, idle_timeout=0.1
+                ))
                 
-            except RuntimeError as e:
+            except ProcessError as e:
                 if "Maximum number of processes" in str(e):
-                    self.pending_downloads.append((widget_id, url, settings))
+                    # A finished download's process is still exiting, retry shortly
+                    self.pending_downloads.appendleft((widget_id, url, settings))
                     widget.set_status("Waiting for available slot...")
                     logger.debug(f"Queued download for later: {url}")
+                    self._schedule_admission_retry()
                     self._update_download_counts()
                     return
                 raise
@@ -501,284 +516,231 @@ class MainWindow:
             logger.error(f"Failed to start download: {str(e)}", exc_info=True)
             messagebox.showerror("Error", f"Failed to start download: {str(e)}")
             
-    def _monitor_youtube_progress(
-        self,
-        widget: DownloadWidget,
-        process_id: str,
-        progress_queue: mp.Queue,
-        has_video: bool,
-        has_audio: bool
-    ):
-        """Monitor progress of YouTube download"""
-        try:
-            # Show appropriate progress bars
-            if has_audio:
-                widget.show_audio_progress()  # Show audio progress if downloading audio
-            if has_video:
-                widget.show_video_progress()  # Show video progress if downloading video
-            is_muxing = False  # Track if we're in muxing phase
-            widget.set_status("Starting download...")  # Initial status - yellow
-            while True:
-                try:
-                    progress = progress_queue.get(timeout=0.1)
-                    if progress['type'] == 'title':
-                        widget.update_title(progress['title'])
-                    elif progress['type'] == 'video_progress':
-                        data = progress.get('data', {})
-                        widget.update_video_progress(
-                            data.get('progress', 0),
-                            data.get('speed', '0MB/s'),
-                            data.get('downloaded', '0MB'),
-                            data.get('total', '0MB')
-                        )
-                    elif progress['type'] == 'audio_progress':
-                        data = progress.get('data', {})
-                        widget.update_audio_progress(
-                            data.get('progress', 0),
-                            data.get('speed', '0MB/s'),
-                            data.get('downloaded', '0MB'),
-                            data.get('total', '0MB')
-                        )
-                    elif progress['type'] == 'muxing_progress':
-                        is_muxing = True  # Set muxing flag
-                        data = progress.get('data', {})
-                        widget.show_muxing_progress()
-                        widget.update_muxing_progress(
-                            data.get('progress', 0),
-                            data.get('status', 'Muxing...')
-                        )
-                        widget.set_status("Muxing video and audio...")  # Update status during muxing
-                    elif progress['type'] == 'status':
-                        widget.set_status(progress['message'])
-                    elif progress['type'] == 'error':
-                        widget.set_status(f"Error: {progress['error']}")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        self._clear_download(process_id)
-                        break
-                    elif progress['type'] == 'cancelled':
-                        widget.set_status("Download cancelled")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        self._clear_download(process_id)
-                        break
-                    elif progress['type'] == 'complete':
-                        if is_muxing:
-                            widget.set_status("Finished!")  # Update status after muxing
-                        else:
-                            widget.set_status(progress.get('message', 'Finished!'))  # Use message if provided
-                        
-                        # Set the downloaded file path if provided
-                        if 'file_path' in progress:
-                            # Support multiple files (video+audio, non-muxed)
-                            if isinstance(progress['file_path'], list):
-                                widget.set_downloaded_path(progress['file_path'])
-                            else:
-                                widget.set_downloaded_path(progress['file_path'])
+    def _start_monitor(self, monitor: "_ProgressMonitor"):
+        """Register a download with the shared progress monitor thread"""
+        with self._monitors_lock:
+            self._monitors[monitor.reader] = monitor
+            if self._monitor_thread is None:
+                self._monitor_thread = threading.Thread(target=self._run_monitors, daemon=True)
+                self._monitor_thread.start()
+                
+    def _run_monitors(self):
+        """Wait on the progress pipes of all downloads at once and dispatch what arrives"""
+        while True:
+            with self._monitors_lock:
+                if not self._monitors:
+                    # The next registered download starts a new thread
+                    self._monitor_thread = None
+                    return
+                monitors = dict(self._monitors)
+            ready = set(mp_connection.wait(list(monitors), timeout=self.MONITOR_POLL_INTERVAL))
+            now = time.monotonic()
+            for reader, monitor in monitors.items():
+                if reader in ready:
+                    monitor.last_seen = now
+                    if self._drain_monitor(monitor):
+                        # Every writer is gone, nothing can block on this pipe anymore
+                        with self._monitors_lock:
+                            self._monitors.pop(reader, None)
+                        reader.close()
+                elif not monitor.finished and now - monitor.last_seen >= monitor.idle_timeout:
+                    # Nothing arrived for a while, check the download is still alive
+                    monitor.last_seen = now
+                    monitor.finished = self._run_monitor_step(monitor, monitor.on_idle)
                         
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        self._clear_download(process_id)
-                        break
-                except queue.Empty:
-                    if not self.process_pool.is_process_running(process_id):
-                        if not is_muxing:  # Only show failure if not in muxing phase
-                            widget.set_status("Download failed")
-                            widget.is_completed = True
-                            widget.is_cancelled = True
-                            self._clear_download(process_id)
-                            break
-        except Exception as e:
-            logger.error(f"Error monitoring progress: {str(e)}", exc_info=True)
-            widget.set_status(f"Error: {str(e)}")
-            widget.is_completed = True
-            widget.is_cancelled = True
-            self._clear_download(process_id)
-            
-    def _monitor_download_progress(
-        self,
-        widget: DownloadWidget,
-        process_id: str,
-        progress_queue: mp.Queue
-    ):
-        """Monitor progress of file download"""
+    def _drain_monitor(self, monitor: "_ProgressMonitor") -> bool:
+        """Dispatch every pending message of one download, True once its pipe reached EOF
+        
+        Messages arriving after the download finished are read and discarded. Closing
+        the reader early would leave a still running sibling stream process, or one
+        whose widget was removed, blocked on a full pipe or failing on a broken one.
+        """
+        reader = monitor.reader
         try:
-            widget.show_file_progress()
-            widget.set_status("Starting download...")  # Initial status - yellow
-            last_update_time = 0
-            MIN_UPDATE_INTERVAL = 0.05
-            while process_id in self.active_downloads:
-                try:
-                    progress = progress_queue.get(timeout=0.5)
-                    current_time = time.time()
-                    if progress['type'] == 'progress':
-                        if current_time - last_update_time >= MIN_UPDATE_INTERVAL:
-                            data = progress.get('data', {})
-                            widget.update_file_progress(
-                                data.get('progress', 0),
-                                data.get('speed', '0MB/s'),
-                                data.get('downloaded', '0MB'),
-                                data.get('total', '0MB')
-                            )
-                            last_update_time = current_time
-                    elif progress['type'] == 'status':
-                        widget.set_status(progress.get('message', ''))
-                    elif progress['type'] == 'title':
-                        widget.update_title(progress['title'])
-                    elif progress['type'] == 'error':
-                        widget.set_status(f"Error: {progress['error']}")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        break
-                    elif progress['type'] == 'cancelled':
-                        widget.set_status("Download cancelled")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        break
-                    elif progress['type'] == 'complete':
-                        widget.set_status("Download complete")
-                        
-                        # Set the downloaded file path if provided
-                        if 'file_path' in progress:
-                            widget.set_downloaded_path(progress['file_path'])
-                        
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        break
-                except queue.Empty:
-                    if not self.process_pool.is_process_running(process_id):
-                        widget.set_status("Download failed")
-                        widget.is_completed = True
-                        widget.is_cancelled = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        break
+            while reader.poll():
+                message = reader.recv()
+                if not monitor.finished:
+                    monitor.finished = self._run_monitor_step(monitor, monitor.on_message, message)
+        except (EOFError, OSError):
+            # Every writer is closed, so the download processes are gone
+            if not monitor.finished:
+                self._run_monitor_step(monitor, self._on_channel_closed)
+            return True
+        return False
+        
+    def _on_channel_closed(self, monitor: "_ProgressMonitor") -> bool:
+        """Fail a download whose processes exited without a final message"""
+        if not monitor.cleared.is_set():
+            self._finish_monitor(monitor, "Download failed")
+        return True
+                
+    def _run_monitor_step(self, monitor: "_ProgressMonitor", handler: Callable, *args) -> bool:
+        """Run one monitor handler, failing the download if it raises"""
+        try:
+            return handler(monitor, *args)
         except Exception as e:
             logger.error(f"Error monitoring progress: {str(e)}", exc_info=True)
-            widget.set_status(f"Error: {str(e)}")
-            widget.is_completed = True
-            widget.is_cancelled = True
-            widget.cancel_btn.configure(text="Clear")
-            self._clear_download(process_id)
-            
+            self._finish_monitor(monitor, f"Error: {str(e)}", state="error")
+            return True
+            
+    def _finish_monitor(self, monitor: "_ProgressMonitor", status: str, state: Optional[str] = None):
+        """Show the final status of a download and free its slot"""
+        widget = monitor.widget
+        # Queued last-wins in the widget's status slot like any other status; the monitor
+        # discards whatever follows, so nothing replaces it before the pump applies it
+        widget.set_status(status, state=state)
+        widget.is_completed = True
+        widget.is_cancelled = True
+        # Freeing the slot starts queued downloads, which must happen on the Tk thread
+        try:
+            self.root.after(0, self._on_download_finished, monitor.widget_id, monitor.process_id)
+        except (RuntimeError, TclError):
+            logger.debug(f"Window closed, not clearing download {monitor.process_id}")
+        
+    def _forward_progress(self, monitor: "_ProgressMonitor", tick: tuple) -> bool:
+        """Pass a (kind, progress, speed, downloaded, total) tick to the widget
+        
+        Not throttled here: the widget keeps only the latest tick per bar until its
+        pump runs, so a burst of ticks still costs one redraw.
+        """
+        kind, progress, speed, downloaded, total = tick
+        self._PROGRESS_UPDATERS[kind](monitor.widget, progress, speed, downloaded, total)
+        return False
+        
+    def _on_title_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        monitor.widget.update_title(progress['title'])
+        return False
+        
+    def _on_status_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        monitor.widget.set_status(progress.get('message', ''))
+        return False
+        
+    def _on_error_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        self._finish_monitor(monitor, f"Error: {progress['error']}", state="error")
+        return True
+        
+    def _on_cancelled_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        self._finish_monitor(monitor, "Download cancelled")
+        return True
+        
+    def _on_muxing_progress_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        monitor.is_muxing = True  # Set muxing flag
+        data = progress.get('data', {})
+        widget = monitor.widget
+        widget.show_muxing_progress()
+        widget.update_muxing_progress(
+            data.get('progress', 0),
+            data.get('status', 'Muxing...')
+        )
+        widget.set_status("Muxing video and audio...")  # Update status during muxing
+        return False
+        
+    def _on_youtube_complete_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        # Set the downloaded file path(s) if provided; video+audio without muxing gives a list
+        if 'file_path' in progress:
+            monitor.widget.set_downloaded_path(progress['file_path'])
+        if monitor.is_muxing:
+            status = "Finished!"  # Update status after muxing
+        else:
+            status = progress.get('message', 'Finished!')  # Use message if provided
+        self._finish_monitor(monitor, status, state="complete")
+        return True
+        
+    def _on_file_complete_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        # Set the downloaded file path if provided
+        if 'file_path' in progress:
+            monitor.widget.set_downloaded_path(progress['file_path'])
+        self._finish_monitor(monitor, "Download complete", state="complete")
+        return True
+        
+    # Widget update per progress tick kind, ticks arrive as flat tuples (ProgressSender.put_progress)
+    _PROGRESS_UPDATERS = {
+        'progress': DownloadWidget.update_file_progress,
+        'video_progress': DownloadWidget.update_video_progress,
+        'audio_progress': DownloadWidget.update_audio_progress,
+    }
+    
+    # Handlers of the other messages by message type, each returns True once the download finished
+    _YOUTUBE_HANDLERS = {
+        'title': _on_title_message,
+        'muxing_progress': _on_muxing_progress_message,
+        'status': _on_status_message,
+        'error': _on_error_message,
+        'cancelled': _on_cancelled_message,
+        'complete': _on_youtube_complete_message,
+    }
+    _FILE_HANDLERS = {
+        'status': _on_status_message,
+        'title': _on_title_message,
+        'error': _on_error_message,
+        'cancelled': _on_cancelled_message,
+        'complete': _on_file_complete_message,
+    }
+        
+    def _on_youtube_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        """Apply one YouTube progress message, True once the download finished"""
+        if progress.__class__ is tuple:
+            return self._forward_progress(monitor, progress)
+        handler = self._YOUTUBE_HANDLERS.get(progress['type'])
+        return handler(self, monitor, progress) if handler else False
+        
+    def _on_youtube_idle(self, monitor: "_ProgressMonitor") -> bool:
+        """Fail a YouTube download whose process exited without reporting"""
+        # Only show failure if not in muxing phase
+        if not monitor.is_muxing and not self.process_pool.is_process_running(monitor.process_id):
+            self._finish_monitor(monitor, "Download failed")
+            return True
+        return False
+        
+    def _on_file_message(self, monitor: "_ProgressMonitor", progress: dict) -> bool:
+        """Apply one file download progress message, True once the download finished"""
+        if monitor.cleared.is_set():
+            return True  # Cancelled, the slot was already freed
+        if progress.__class__ is tuple:
+            return self._forward_progress(monitor, progress)
+        handler = self._FILE_HANDLERS.get(progress['type'])
+        return handler(self, monitor, progress) if handler else False
+        
+    def _on_file_idle(self, monitor: "_ProgressMonitor") -> bool:
+        """Stop monitoring a cancelled file download, fail one whose process died"""
+        if monitor.cleared.is_set():
+            return True  # Cancelled, the slot was already freed
+        if not self.process_pool.is_process_running(monitor.process_id):
+            self._finish_monitor(monitor, "Download failed")
+            return True
+        return False
+            
+    def _on_download_finished(self, widget_id: int, process_id: str):
+        """Record a finished download and free its slot"""
+        if widget_id in self.downloads:
+            self._completed_widget_ids.add(widget_id)
+        self._clear_download(process_id)
+        
     def _clear_download(self, process_id: str):
         """Remove a download from active downloads"""
-        if process_id in self.active_downloads:
-            self.active_downloads.remove(process_id)
+        cleared = self.active_downloads.pop(process_id, None)
+        if cleared is not None:
+            cleared.set()
             self._check_pending_downloads()
             self._update_download_counts()
             
-    def _check_pending_downloads(self):
-        """Check if there are pending downloads that can be started"""
-        # Clean up completed processes first
-        self.process_pool.cleanup_completed()
+    def _process_urls(self, urls: List[str], settings: dict):
+        """Start downloads for the valid URLs and leave the invalid ones in the URL box
         
-        # Now check how many active processes we have
-        active_processes = len([p for p in self.process_pool.processes.values() if p.is_alive()])
-
-        while active_processes < self.process_pool.max_processes and self.pending_downloads:
-            widget_id, url, settings = self.pending_downloads.pop(0)
-            try:
-                if is_youtube_url(url):
-                    self._download_youtube(widget_id, url, settings)
-                else:
-                    self._download_file(widget_id, url, settings)
-            except Exception as e:
-                logger.error(f"Error starting pending download {url}: {str(e)}", exc_info=True)
-                messagebox.showerror("Error", f"Failed to start download: {str(e)}")
-            
-            # Recalculate active processes after starting a download
-            active_processes = len([p for p in self.process_pool.processes.values() if p.is_alive()])
-
-        # Schedule next check if there are still pending downloads
-        if self.pending_downloads:
-            self.root.after(1000, self._check_pending_downloads)
-        self._update_download_counts()
-            
-    def _process_next_url(self, urls, settings, remaining_urls):
-        """Process next URL in the list asynchronously"""
-        if not urls:
-            # All URLs processed, update text box with remaining URLs
-            self.url_text.delete("1.0", "end")
-            if remaining_urls:
-                for url in remaining_urls:
-                    self.url_text.insert("end", url + "\n")
-            return
-
-        # Process URLs in batches of 5 to avoid overwhelming the system
-        batch_size = 5
-        current_batch = urls[:batch_size]
-        remaining_batch = urls[batch_size:]
-
-        # Update text box to remove the processed URLs
-        self.url_text.delete("1.0", "end")
-        # Add remaining unprocessed URLs
-        for remaining_url in remaining_batch:
-            self.url_text.insert("end", remaining_url + "\n")
-        # Add previously invalid URLs
-        for invalid_url in remaining_urls:
-            self.url_text.insert("end", invalid_url + "\n")
-
-        # Create a queue to track validation results
-        validation_queue = queue.Queue()
-        validation_threads = []
-
-        def validate_url(url_to_validate):
-            """Validate a single URL"""
-            if '.' not in url_to_validate or not all(p.strip() for p in url_to_validate.split('.')):
-                validation_queue.put((url_to_validate, False))
-                return
-
-            try:
-                session = requests.Session()
-                session.headers.update({
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                })
-                url_to_check = url_to_validate if url_to_validate.startswith(('http://', 'https://')) else f'https://{url_to_validate}'
-                response = session.head(url_to_check, timeout=5, allow_redirects=True)
-                response.raise_for_status()
-                validation_queue.put((url_to_validate, True))
-            except Exception as e:
-                logger.debug(f"Invalid URL {url_to_validate}: {str(e)}")
-                validation_queue.put((url_to_validate, False))
-
-        # Start validation threads for the batch
-        for url in current_batch:
-            thread = threading.Thread(target=validate_url, args=(url,), daemon=True)
-            validation_threads.append(thread)
-            thread.start()
-
-        def check_validation_results():
-            """Check validation results and start downloads"""
-            completed = 0
-            new_remaining_urls = []
-
-            # Check how many validations are complete
-            while not validation_queue.empty():
-                url, is_valid = validation_queue.get()
-                completed += 1
-                if is_valid:
-                    # URL is valid, start or queue download
-                    self._start_single_download(url, settings.copy())
-                else:
-                    new_remaining_urls.append(url)
-
-            if completed < len(current_batch):
-                # Not all validations are complete, check again after a short delay
-                self.root.after(100, check_validation_results)
+        URLs are only checked for a plausible host. Reachability is left to the
+        download process, which reports a failing URL on its widget.
+        """
+        invalid_urls = []
+        for url in urls:
+            if is_valid_url(url):
+                self._start_single_download(url, settings)
             else:
-                # All validations in this batch are complete, process next batch
-                remaining_urls.extend(new_remaining_urls)
-                self.root.after(1, lambda: self._process_next_url(remaining_batch, settings, remaining_urls))
-
-        # Start checking validation results
-        self.root.after(100, check_validation_results)
+                logger.debug(f"Invalid URL {url}")
+                invalid_urls.append(url)
+                
+        self.url_text.delete("1.0", "end")
+        if invalid_urls:
+            self.url_text.insert("end", "".join(url + "\n" for url in invalid_urls))
             
     def _start_single_download(self, url: str, settings: dict):
         """Start or queue a single download"""
@@ -828,48 +790,35 @@ class MainWindow:
             widget = self.downloads[widget_id]
             widget.set_status("Waiting for available slot...")
             widget.hide_progress_frame()
-            self.root.after(1000, self._check_pending_downloads)
         self._update_download_counts()
             
+    def _get_url_lines(self) -> List[str]:
+        """Get the non-empty, stripped lines of the URL box"""
+        # "end-1c" skips the newline Tk always keeps at the end of the text
+        return [url for url in (line.strip() for line in self.url_text.get("1.0", "end-1c").splitlines()) if url]
+        
     def _start_downloads(self):
         """Start downloading all URLs"""
         try:
             # Get URLs from text box
-            all_urls = [url.strip() for url in self.url_text.get("1.0", "end").split("\n") if url.strip()]
+            all_urls = self._get_url_lines()
             if not all_urls:
                 return
             
             # Check if there are any playlist URLs
-            has_playlists = any("list=" in url for url in all_urls)
+            has_playlists = any(is_playlist_url(url) for url in all_urls)
             
             if has_playlists:
-                # Only handle playlists, keep other URLs in the text field
-                remaining_urls = []
-                extracted_videos = []
-                
-                for url in all_urls:
-                    if "list=" in url:
-                        try:
-                            playlist_urls = YouTubeDownloader.get_playlist_urls(url)
-                            if playlist_urls:
-                                logger.info(f"Found {len(playlist_urls)} videos in playlist")
-                                extracted_videos.extend(playlist_urls)
-                            else:
-                                logger.debug(f"No videos found in playlist: {url}")
-                                remaining_urls.append(url)
-                        except Exception as e:
-                            logger.debug(f"Failed to get playlist info: {str(e)}")
-                            remaining_urls.append(url)
-                    else:
-                        remaining_urls.append(url)
-                
-                # Update text box with remaining URLs and extracted videos
-                self.url_text.delete("1.0", "end")
-                for url in remaining_urls + extracted_videos:
-                    self.url_text.insert("end", url + "\n")
+                # Playlist extraction queries YouTube, keep it off the Tk thread
+                self.download_btn.configure(state="disabled")
+                threading.Thread(
+                    target=self._extract_playlists,
+                    args=(all_urls,),
+                    daemon=True
+                ).start()
                 return
                 
-            # Get current settings
+            # Snapshot of the current settings, read-only and shared by every URL of this batch
             settings = {
                 'download_folder': self.settings_panel.folder_var.get(),
                 'video_quality': self.settings_panel.video_quality.get(),
@@ -879,12 +828,44 @@ class MainWindow:
                 'muxing_enabled': self.settings_panel.muxing_enabled.get()
             }
             
-            # Start processing URLs asynchronously
-            self._process_next_url(all_urls.copy(), settings, [])
+            # Start downloads for the valid URLs
+            self._process_urls(all_urls, settings)
             
         except Exception as e:
             logger.error(f"Error starting downloads: {str(e)}", exc_info=True)
             
+    def _extract_playlists(self, all_urls: List[str]):
+        """Expand playlist URLs into their videos, runs on a worker thread"""
+        remaining_urls = []
+        extracted_videos = []
+        
+        for url in all_urls:
+            if is_playlist_url(url):
+                try:
+                    playlist_urls = YouTubeDownloader.get_playlist_urls(url)
+                    if playlist_urls:
+                        logger.info(f"Found {len(playlist_urls)} videos in playlist")
+                        extracted_videos.extend(playlist_urls)
+                    else:
+                        logger.debug(f"No videos found in playlist: {url}")
+                        remaining_urls.append(url)
+                except Exception as e:
+                    logger.debug(f"Failed to get playlist info: {str(e)}")
+                    remaining_urls.append(url)
+            else:
+                remaining_urls.append(url)
+                
+        try:
+            self.root.after(0, self._show_extracted_urls, remaining_urls + extracted_videos)
+        except (RuntimeError, TclError):
+            logger.debug("Window closed, dropping extracted playlist URLs")
+            
+    def _show_extracted_urls(self, urls: List[str]):
+        """Replace the URL box content with the other URLs and the extracted videos"""
+        self.url_text.delete("1.0", "end")
+        self.url_text.insert("end", "".join(url + "\n" for url in urls))
+        self.download_btn.configure(state="normal")
+        
     def _on_folder_change(self, folder: Path):
         """Handle download folder change"""
         pass  # Nothing to do, folder is stored in settings
@@ -926,14 +907,14 @@ class MainWindow:
             self.url_text.edit_modified(False)
             
             # Get URLs from text field
-            urls = [url.strip() for url in self.url_text.get("1.0", "end").split("\n") if url.strip()]
+            urls = self._get_url_lines()
             
             # Update settings panel checkbox visibility based on URL content
             if hasattr(self, 'settings_panel'):
                 self.settings_panel.update_checkbox_visibility(urls)
             
             # Check content for playlist URLs
-            has_playlists = any("list=" in url for url in urls)
+            has_playlists = any(is_playlist_url(url) for url in urls)
             
             # Update button text
             self.download_btn.configure(
@@ -959,7 +940,7 @@ class MainWindow:
             widget = self.downloads[widget_id]
             widget.is_cancelled = True
             widget.set_status("Download cancelled")
-            widget.cancel_btn.configure(text="Clear")
+            self._completed_widget_ids.add(widget_id)
             
         # Clear the pending URLs list
         self.pending_downloads.clear()
@@ -982,7 +963,7 @@ class MainWindow:
             if not widget.is_completed:  # Don't modify completed downloads
                 widget.is_cancelled = True
                 widget.set_status("Download cancelled")
-                widget.cancel_btn.configure(text="Clear")
+                self._completed_widget_ids.add(widget_id)
                 
                 # Cancel the process if it's active
                 if hasattr(widget, 'process_id') and widget.process_id:
@@ -1001,87 +982,19 @@ class MainWindow:
         """Start the application"""
         self.root.mainloop()
 
-    def _handle_download_error(self, process_id, error_msg):
-        """Handle download error"""
-        if process_id in self.active_downloads:
-            self.active_downloads.remove(process_id)
-            self._process_pending_downloads()
-            self._update_download_counts()
-        logger.error(f"Download error: {error_msg}")
-
-    def _process_progress_updates(self):
-        """Process any progress updates from the progress queue"""
-        try:
-            while True:  # Process all available updates
-                update = self.progress_queue.get_nowait()
-                process_id = update.get('process_id')
-                if process_id in self.downloads:
-                    widget = self.downloads[process_id]
-                    
-                    if 'error' in update:
-                        # Handle error
-                        error_msg = str(update['error'])
-                        widget.set_status(f"Error: {error_msg}")
-                        widget.cancel_btn.configure(text="Clear")
-                        self._handle_download_error(process_id, error_msg)
-                        self._update_download_counts()
-                        
-                    elif update.get('status') == 'completed':
-                        # Handle completion
-                        widget.set_status("Completed")
-                        widget.is_completed = True
-                        widget.cancel_btn.configure(text="Clear")
-                        self._clear_download(process_id)
-                        self._update_download_counts()
-                        
-                    elif 'progress' in update:
-                        # Update progress
-                        progress = update['progress']
-                        if 'video' in progress:
-                            widget.show_video_progress()
-                            widget.update_video_progress(
-                                progress['video'].get('progress', 0),
-                                progress['video'].get('speed', '0 KB/s'),
-                                progress['video'].get('downloaded', '0 MB'),
-                                progress['video'].get('total', '0 MB')
-                            )
-                        if 'audio' in progress:
-                            widget.show_audio_progress()
-                            widget.update_audio_progress(
-                                progress['audio'].get('progress', 0),
-                                progress['audio'].get('speed', '0 KB/s'),
-                                progress['audio'].get('downloaded', '0 MB'),
-                                progress['audio'].get('total', '0 MB')
-                            )
-                        if 'muxing' in progress:
-                            widget.show_muxing_progress()
-                            widget.update_muxing_progress(
-                                progress['muxing'].get('progress', 0),
-                                progress['muxing'].get('status', 'Muxing...')
-                            )
-                        # Update single progress bar for regular downloads
-                        elif 'progress' in progress:
-                            widget.show_video_progress()
-                            widget.update_video_progress(
-                                progress.get('progress', 0),
-                                progress.get('speed', '0 KB/s'),
-                                progress.get('downloaded', '0 MB'),
-                                progress.get('total', '0 MB')
-                            )
-                
-        except queue.Empty:
-            pass  # No more updates to process
-        except Exception as e:
-            logger.error(f"Error processing progress updates: {str(e)}", exc_info=True)
-        finally:
-            # Schedule next update
-            self.root.after(100, self._process_progress_updates)
-
     def _check_pending_downloads(self):
-        """Check if there are pending downloads that can be started"""
+        """Start pending downloads while there are free slots
+        
+        Runs on the Tk thread whenever a slot frees up or the limit changes,
+        so nothing needs to poll for free slots.
+        """
         while (len(self.active_downloads) < self.process_pool.max_processes and 
                self.pending_downloads):
-            widget_id, url, settings = self.pending_downloads.pop(0)
+            if self.process_pool.alive_count >= self.process_pool.max_processes:
+                # A slot is freed on the complete message, its process may not have exited yet
+                self._schedule_admission_retry()
+                break
+            widget_id, url, settings = self.pending_downloads.popleft()
             try:
                 if is_youtube_url(url):
                     self._download_youtube(widget_id, url, settings)
@@ -1090,12 +1003,18 @@ class MainWindow:
             except Exception as e:
                 logger.error(f"Error starting pending download {url}: {str(e)}", exc_info=True)
                 messagebox.showerror("Error", f"Failed to start download: {str(e)}")
-            
-            # Recalculate active processes after starting a download
-            active_processes = len([p for p in self.process_pool.processes.values() if p.is_alive()])
 
         # Update counts after processing pending downloads
         self._update_download_counts()
+        
+    def _schedule_admission_retry(self):
+        """Check pending downloads again shortly, once per burst of full-pool hits"""
+        if self._admission_retry_id is None:
+            self._admission_retry_id = self.root.after(self.ADMISSION_RETRY_MS, self._retry_admission)
+            
+    def _retry_admission(self):
+        self._admission_retry_id = None
+        self._check_pending_downloads()
 
     def _settings_changed(self, setting_name: str, value: Any):
         """Handle settings changes"""
@@ -3,14 +3,14 @@ from urllib.parse import urlparse, unquote
 import os
 import re
 
+_YOUTUBE_URL_RE = re.compile(
+    r'^https?://(?:(?:www\.)?youtube\.com/(?:watch\?v=|v/)|youtu\.be/)[\w-]+'
+)
+
+
 def is_youtube_url(url: str) -> bool:
     """Check if URL is a YouTube video URL"""
-    patterns = [
-        r'^https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'^https?://(?:www\.)?youtube\.com/v/[\w-]+',
-        r'^https?://youtu\.be/[\w-]+'
-    ]
-    return any(re.match(pattern, url) for pattern in patterns)
+    return _YOUTUBE_URL_RE.match(url) is not None
 
 def sanitize_filename(filename: str) -> str:
     """Remove invalid characters from filename"""
@@ -3,14 +3,29 @@ import re
 import os
 
 
+_YOUTUBE_URL_RE = re.compile(
+    r'^https?://(?:(?:www\.)?youtube\.com/(?:watch\?v=|v/)|youtu\.be/)[\w-]+'
+)
+_PLAYLIST_RE = re.compile(r'[?&]list=')
+
+
 def is_youtube_url(url: str) -> bool:
     """Check if URL is a YouTube video URL"""
-    patterns = [
-        r'^https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'^https?://(?:www\.)?youtube\.com/v/[\w-]+',
-        r'^https?://youtu\.be/[\w-]+'
-    ]
-    return any(re.match(pattern, url) for pattern in patterns)
+    return _YOUTUBE_URL_RE.match(url) is not None
+
+
+def is_playlist_url(url: str) -> bool:
+    """Check if URL carries a playlist parameter"""
+    return _PLAYLIST_RE.search(url) is not None
+
+
+def is_valid_url(url: str) -> bool:
+    """Check if URL has a plausible host, URLs without a scheme count as https"""
+    try:
+        host = urlparse(url if url.startswith(('http://', 'https://')) else f'https://{url}').hostname
+    except ValueError:
+        return False
+    return bool(host) and '.' in host and all(part.strip() for part in host.split('.'))
 
 
 def sanitize_filename(filename: str) -> str: